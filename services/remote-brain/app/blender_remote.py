@@ -1,63 +1,154 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 import json
 import socket
+import time
 from typing import Any
 
+import orjson
+
+RECV_BUFFER_SIZE = 65536
+
 
 class BlenderRemoteError(RuntimeError):
     pass
 
 
-def _recv_json(sock: socket.socket, timeout_seconds: float = 45.0) -> dict[str, Any]:
-    sock.settimeout(timeout_seconds)
-    chunks: list[bytes] = []
+def _loads(data: memoryview) -> dict[str, Any]:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # The addon encodes with stdlib json, which emits NaN/Infinity and
+        # lone surrogate escapes that orjson rejects; accept them the same way.
+        return json.loads(bytes(data))
+
+
+def _try_decode(data: memoryview) -> dict[str, Any] | None:
+    # The addon replies with a single JSON object and no length prefix or
+    # terminator; that wire format is shared with the Tauri client and
+    # upstream blender-mcp, so it cannot grow a sentinel. Data that does not
+    # end in "}" cannot be complete yet, and a failed orjson parse is cheaper
+    # than tracking string-aware brace depth in Python, so that check alone
+    # gates the parse.
+    if data[-1:] != b"}":
+        return None
+
+    try:
+        return _loads(data)
+    except ValueError:
+        return None
+
+
+def _decode_final(data: memoryview) -> dict[str, Any]:
+    if not data:
+        raise BlenderRemoteError("No response received from Blender addon.")
+
+    try:
+        return _loads(data)
+    except ValueError as exc:
+        raise BlenderRemoteError("Blender addon response was not valid JSON.") from exc
+
+
+async def _recv_json(sock: socket.socket, timeout_seconds: float = 45.0) -> dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    buffer = bytearray(RECV_BUFFER_SIZE)
+    size = 0
 
     while True:
+        if size == len(buffer):
+            buffer.extend(bytes(len(buffer)))
+
+        free = memoryview(buffer)[size:]
         try:
-            chunk = sock.recv(8192)
-        except socket.timeout as exc:
-            if chunks:
+            received = await asyncio.wait_for(loop.sock_recv_into(sock, free), timeout=timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            if size:
                 break
             raise BlenderRemoteError("Timeout waiting for Blender addon response.") from exc
+        finally:
+            free.release()
 
-        if not chunk:
+        if not received:
             break
 
-        chunks.append(chunk)
-        data = b"".join(chunks)
-        try:
-            return json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError:
-            continue
+        size += received
+        with memoryview(buffer)[:size] as data:
+            response = _try_decode(data)
+        if response is not None:
+            return response
+
+    with memoryview(buffer)[:size] as data:
+        return _decode_final(data)
 
-    if not chunks:
-        raise BlenderRemoteError("No response received from Blender addon.")
 
+def _peer_closed(sock: socket.socket) -> bool:
+    # An idle connection has nothing to read until a command is sent, so any
+    # readable state (EOF, a reset or stray bytes) means it cannot be reused.
     try:
-        return json.loads(b"".join(chunks).decode("utf-8"))
-    except json.JSONDecodeError as exc:
-        raise BlenderRemoteError("Blender addon response was not valid JSON.") from exc
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+    return True
 
 
-def send_blender_command(
-    host: str,
-    port: int,
-    command_type: str,
-    params: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+# Keepalive probing for pooled links: start after 10s idle, probe every 5s and
+# give up after 3 misses, so a vanished Blender is noticed in ~25s rather
+# than the OS default of two hours.
+_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 10),
+    ("TCP_KEEPINTVL", 5),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    # Commands and replies are single small writes; disable Nagle so they are
+    # not held back waiting on delayed ACKs.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in _KEEPALIVE_OPTIONS:
+        option = getattr(socket, name, None)
+        if option is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            except OSError:
+                pass
+
+
+async def _open_socket(host: str, port: int) -> socket.socket:
+    loop = asyncio.get_running_loop()
+    error: OSError | None = None
+
+    for family, sock_type, proto, _, address in await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+        sock = socket.socket(family, sock_type, proto)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, address)
+        except OSError as exc:
+            sock.close()
+            error = exc
+            continue
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    raise error or OSError(f"No address found for {host}:{port}")
+
+
+def _encode_command(command_type: str, params: dict[str, Any] | None) -> bytes:
     payload = {
         "type": command_type,
         "params": params or {},
     }
+    return orjson.dumps(payload)
 
-    try:
-        with socket.create_connection((host, port), timeout=8.0) as sock:
-            sock.sendall(json.dumps(payload).encode("utf-8"))
-            response = _recv_json(sock)
-    except OSError as exc:
-        raise BlenderRemoteError(f"Could not connect to Blender addon at {host}:{port}: {exc}") from exc
 
+def _check_response(response: dict[str, Any]) -> dict[str, Any]:
     if response.get("status") == "error":
         message = response.get("message") or "Unknown Blender addon error"
         raise BlenderRemoteError(str(message))
@@ -65,15 +156,167 @@ def send_blender_command(
     return response
 
 
-def get_scene_info(host: str, port: int = 9876) -> dict[str, Any]:
-    return send_blender_command(host=host, port=port, command_type="get_scene_info")
+class BlenderConnectionPool:
+    """Persistent addon connections, one per (host, port).
+
+    The addon serves commands on a connection one after another, so each
+    endpoint is guarded by a lock while separate Blender instances are
+    driven concurrently. Replies keep the addon's unframed JSON protocol.
+    Connections are plain non-blocking sockets driven through the loop's
+    ``sock_*`` methods, so replies are received straight into a buffer.
+    Idle connections are closed after ``idle_timeout`` seconds and at most
+    ``max_idle`` are kept, least recently used first out.
+    """
+
+    def __init__(self, connect_timeout: float = 8.0, idle_timeout: float = 30.0, max_idle: int = 32) -> None:
+        self._connect_timeout = connect_timeout
+        self._idle_timeout = idle_timeout
+        self._max_idle = max_idle
+        self._idle: OrderedDict[tuple[str, int], tuple[socket.socket, float]] = OrderedDict()
+        # Lock plus the number of callers holding or waiting on it, so the
+        # entry can be dropped once nobody needs it.
+        self._locks: dict[tuple[str, int], tuple[asyncio.Lock, int]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def send(
+        self,
+        host: str,
+        port: int,
+        command_type: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        self._bind_loop()
+        key = (host, port)
+        payload = _encode_command(command_type, params)
+
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+
+        try:
+            async with lock:
+                response = await self._exchange(key, payload)
+        finally:
+            entry = self._locks.get(key)
+            if entry is not None and entry[0] is lock:
+                if entry[1] <= 1:
+                    del self._locks[key]
+                else:
+                    self._locks[key] = (lock, entry[1] - 1)
+
+        return _check_response(response)
+
+    async def close(self) -> None:
+        connections = list(self._idle.values())
+        self._idle.clear()
+        for sock, _ in connections:
+            sock.close()
+
+    async def _exchange(self, key: tuple[str, int], payload: bytes) -> dict[str, Any]:
+        host, port = key
+        sock = self._take_idle(key)
+        if sock is not None:
+            # _take_idle already dropped connections the addon has closed. If
+            # the write still fails, the command never reached the addon, so it
+            # is safe to resend it on a fresh connection. Once it is written the
+            # addon may already be running it, so a connection lost while
+            # waiting for the reply is reported instead of retried.
+            try:
+                await self._send(sock, payload)
+            except OSError:
+                sock = None
+
+        if sock is None:
+            sock = await self._connect(host, port)
+            try:
+                await self._send(sock, payload)
+            except OSError as exc:
+                raise BlenderRemoteError(f"Could not connect to Blender addon at {host}:{port}: {exc}") from exc
+
+        try:
+            response = await _recv_json(sock)
+        except BaseException as exc:
+            sock.close()
+            if isinstance(exc, OSError):
+                raise BlenderRemoteError(f"Lost connection to Blender addon at {host}:{port}: {exc}") from exc
+            raise
+
+        self._put_idle(key, sock)
+        return response
+
+    @staticmethod
+    async def _send(sock: socket.socket, payload: bytes) -> None:
+        try:
+            await asyncio.get_running_loop().sock_sendall(sock, payload)
+        except BaseException:
+            sock.close()
+            raise
+
+    def _take_idle(self, key: tuple[str, int]) -> socket.socket | None:
+        entry = self._idle.pop(key, None)
+        if entry is None:
+            return None
+
+        sock, last_used = entry
+        if time.monotonic() - last_used > self._idle_timeout or _peer_closed(sock):
+            sock.close()
+            return None
+        return sock
+
+    def _put_idle(self, key: tuple[str, int], sock: socket.socket) -> None:
+        now = time.monotonic()
+        self._idle[key] = (sock, now)
+
+        while self._idle:
+            oldest_key, (oldest, last_used) = next(iter(self._idle.items()))
+            if len(self._idle) <= self._max_idle and now - last_used <= self._idle_timeout:
+                break
+            del self._idle[oldest_key]
+            oldest.close()
+
+    def _bind_loop(self) -> None:
+        # Locks belong to the loop that created them, and a socket left over
+        # from another loop is not worth trusting.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            for sock, _ in self._idle.values():
+                sock.close()
+            self._idle.clear()
+            self._locks.clear()
+            self._loop = loop
+
+    async def _connect(self, host: str, port: int) -> socket.socket:
+        try:
+            sock = await asyncio.wait_for(_open_socket(host, port), timeout=self._connect_timeout)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise BlenderRemoteError(f"Could not connect to Blender addon at {host}:{port}: {exc}") from exc
+
+        _tune_socket(sock)
+        return sock
+
+
+blender_pool = BlenderConnectionPool()
+
+
+async def send_blender_command(
+    host: str,
+    port: int,
+    command_type: str,
+    params: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return await blender_pool.send(host, port, command_type, params)
+
+
+async def get_scene_info(host: str, port: int = 9876) -> dict[str, Any]:
+    return await send_blender_command(host=host, port=port, command_type="get_scene_info")
 
 
-def execute_code(host: str, port: int, code: str) -> dict[str, Any]:
+async def execute_code(host: str, port: int, code: str) -> dict[str, Any]:
     if not code.strip():
         raise BlenderRemoteError("Generated code is empty.")
 
-    return send_blender_command(
+    return await send_blender_command(
         host=host,
         port=port,
         command_type="execute_code",
@@ -7,7 +7,19 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 
-@dataclass(frozen=True)
+ENV_FILE = Path(__file__).resolve().parents[1] / ".env"
+
+# Tauri webview origins (macOS/Linux and Windows) plus the Vite dev server.
+DEFAULT_ALLOWED_ORIGINS = (
+    "tauri://localhost",
+    "http://tauri.localhost",
+    "https://tauri.localhost",
+    "http://127.0.0.1:1420",
+    "http://localhost:1420",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     remote_brain_token: str | None
     openai_api_key: str | None
@@ -18,12 +30,12 @@ class Settings:
     default_openai_model: str
     default_anthropic_model: str
     default_groq_model: str
+    allowed_origins: tuple[str, ...]
 
 
     @staticmethod
     def from_env() -> "Settings":
-        env_file = Path(__file__).resolve().parents[1] / ".env"
-        load_dotenv(env_file, override=False)
+        load_dotenv(ENV_FILE, override=False)
 
         return Settings(
             remote_brain_token=os.getenv("REMOTE_BRAIN_TOKEN"),
@@ -35,4 +47,12 @@ class Settings:
             default_openai_model=os.getenv("DEFAULT_OPENAI_MODEL", "gpt-4o-mini"),
             default_anthropic_model=os.getenv("DEFAULT_ANTHROPIC_MODEL", "claude-3-5-sonnet-latest"),
             default_groq_model=os.getenv("DEFAULT_GROQ_MODEL", "llama-3.3-70b-versatile"),
+            allowed_origins=_parse_origins(os.getenv("ALLOWED_ORIGINS")),
         )
+
+
+def _parse_origins(raw: str | None) -> tuple[str, ...]:
+    if not raw or not raw.strip():
+        return DEFAULT_ALLOWED_ORIGINS
+
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
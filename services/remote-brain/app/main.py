@@ -1,30 +1,53 @@
 from __future__ import annotations
 
+import hmac
+from typing import Annotated, Any, AsyncGenerator, AsyncIterator, TypeVar
+
+import msgspec
+import orjson
 from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from .config import Settings
+from .orjson_response import ORJSONResponse
 from .blender_remote import BlenderRemoteError, execute_code as remote_execute_code
-from .providers import ProviderError, generate_python_code
-from .upstream_blender_mcp import UPSTREAM_DIR, build_system_prompt
+from .providers import (
+    FencedCodeScanner,
+    ProviderError,
+    generate_python_code,
+    stream_python_code,
+)
+from .upstream_blender_mcp import SYSTEM_PROMPT, UPSTREAM_DIR
 
 
-app = FastAPI(title="Blender AI Remote Brain", version="0.1.0")
+app = FastAPI(
+    title="Blender AI Remote Brain",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 settings = Settings.from_env()
+EXPECTED_AUTHORIZATION = (
+    f"Bearer {settings.remote_brain_token}".encode("utf-8") if settings.remote_brain_token else None
+)
 
 # Local/dev desktop clients and browser checks can trigger CORS preflight.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(settings.allowed_origins),
     allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 
-class GenerateRequest(BaseModel):
-    prompt: str = Field(min_length=1)
+# Request bodies are decoded and validated by msgspec; the Pydantic models
+# below only describe response shapes for the OpenAPI schema.
+class GenerateRequest(msgspec.Struct):
+    prompt: Annotated[str, msgspec.Meta(min_length=1)]
     model: str | None = None
     projectId: str | None = None
 
@@ -35,8 +58,8 @@ class GenerateResponse(BaseModel):
     model: str
 
 
-class GenerateAndApplyRequest(BaseModel):
-    prompt: str = Field(min_length=1)
+class GenerateAndApplyRequest(msgspec.Struct):
+    prompt: Annotated[str, msgspec.Meta(min_length=1)]
     model: str | None = None
     projectId: str | None = None
     blender_host: str | None = None
@@ -51,7 +74,7 @@ class GenerateAndApplyResponse(BaseModel):
     blender_host: str
     blender_port: int
     message: str
-    blender_result: dict | list | str | int | float | bool | None = None
+    blender_result: Any = None
     python_code: str | None = None
 
 
@@ -64,6 +87,40 @@ class CapabilitiesResponse(BaseModel):
     default_provider: str
 
 
+RequestBody = TypeVar("RequestBody", bound=msgspec.Struct)
+
+
+def _request_body_openapi(body_type: type[msgspec.Struct]) -> dict[str, Any]:
+    _, components = msgspec.json.schema_components([body_type])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[body_type.__name__]}},
+        }
+    }
+
+
+async def _decode_body(request: Request, body_type: type[RequestBody]) -> RequestBody:
+    # strict=False keeps Pydantic's lax coercions (e.g. "9876" for an int), and
+    # errors go through FastAPI's validation handler so clients still get the
+    # usual 422 body with a list of errors under "detail".
+    try:
+        return msgspec.json.decode(await request.body(), type=body_type, strict=False)
+    except msgspec.ValidationError as exc:
+        raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(exc)}]) from exc
+    except msgspec.DecodeError as exc:
+        raise RequestValidationError([{"type": "json_invalid", "loc": ("body",), "msg": str(exc)}]) from exc
+
+
+def _require_authorization(authorization: str | None) -> None:
+    if EXPECTED_AUTHORIZATION is None:
+        return
+
+    provided = (authorization or "").encode("utf-8")
+    if not hmac.compare_digest(provided, EXPECTED_AUTHORIZATION):
+        raise HTTPException(status_code=401, detail="Invalid bearer token")
+
+
 @app.get("/health")
 def health() -> dict[str, str | bool]:
     return {
@@ -80,36 +137,39 @@ def root() -> dict[str, str]:
     }
 
 
-@app.get("/capabilities", response_model=CapabilitiesResponse)
+@app.get("/capabilities", response_model=None, responses={200: {"model": CapabilitiesResponse}})
 def capabilities() -> CapabilitiesResponse:
-    return CapabilitiesResponse(
+    # Built from settings we already trust, so skip field validation.
+    return CapabilitiesResponse.model_construct(
         providers={
-            "openai": ProviderCapability(configured=bool((settings.openai_api_key or "").strip())),
-            "anthropic": ProviderCapability(configured=bool((settings.anthropic_api_key or "").strip())),
-            "groq": ProviderCapability(configured=bool((settings.groq_api_key or "").strip())),
+            "openai": ProviderCapability.model_construct(configured=bool((settings.openai_api_key or "").strip())),
+            "anthropic": ProviderCapability.model_construct(
+                configured=bool((settings.anthropic_api_key or "").strip())
+            ),
+            "groq": ProviderCapability.model_construct(configured=bool((settings.groq_api_key or "").strip())),
         },
         default_provider=settings.default_provider,
     )
 
 
-@app.post("/generate", response_model=GenerateResponse)
-def generate(req: GenerateRequest, authorization: str | None = Header(default=None)) -> GenerateResponse:
-    if settings.remote_brain_token:
-        expected = f"Bearer {settings.remote_brain_token}"
-        if authorization != expected:
-            raise HTTPException(status_code=401, detail="Invalid bearer token")
+@app.post(
+    "/generate",
+    responses={200: {"model": GenerateResponse}},
+    openapi_extra=_request_body_openapi(GenerateRequest),
+)
+async def generate(request: Request, authorization: str | None = Header(default=None)) -> ORJSONResponse:
+    _require_authorization(authorization)
+    req = await _decode_body(request, GenerateRequest)
 
     prompt = req.prompt.strip()
     if not prompt:
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
 
-    system_prompt = build_system_prompt()
-
     try:
-        code, provider, selected_model = generate_python_code(
+        code, provider, selected_model = await generate_python_code(
             prompt=prompt,
             model=req.model,
-            system_prompt=system_prompt,
+            system_prompt=SYSTEM_PROMPT,
             settings=settings,
         )
     except ProviderError as exc:
@@ -117,31 +177,30 @@ def generate(req: GenerateRequest, authorization: str | None = Header(default=No
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Generation failed: {exc}") from exc
 
-    return GenerateResponse(python_code=code, provider=provider, model=selected_model)
+    return ORJSONResponse({"python_code": code, "provider": provider, "model": selected_model})
 
 
-@app.post("/generate-and-apply", response_model=GenerateAndApplyResponse)
-def generate_and_apply(
-    req: GenerateAndApplyRequest,
+@app.post(
+    "/generate-and-apply",
+    responses={200: {"model": GenerateAndApplyResponse}},
+    openapi_extra=_request_body_openapi(GenerateAndApplyRequest),
+)
+async def generate_and_apply(
     request: Request,
     authorization: str | None = Header(default=None),
-) -> GenerateAndApplyResponse:
-    if settings.remote_brain_token:
-        expected = f"Bearer {settings.remote_brain_token}"
-        if authorization != expected:
-            raise HTTPException(status_code=401, detail="Invalid bearer token")
+) -> ORJSONResponse:
+    _require_authorization(authorization)
+    req = await _decode_body(request, GenerateAndApplyRequest)
 
     prompt = req.prompt.strip()
     if not prompt:
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
 
-    system_prompt = build_system_prompt()
-
     try:
-        code, provider, selected_model = generate_python_code(
+        code, provider, selected_model = await generate_python_code(
             prompt=prompt,
             model=req.model,
-            system_prompt=system_prompt,
+            system_prompt=SYSTEM_PROMPT,
             settings=settings,
         )
     except ProviderError as exc:
@@ -149,6 +208,55 @@ def generate_and_apply(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Generation failed: {exc}") from exc
 
+    blender_host = _resolve_blender_host(req, request)
+
+    try:
+        response = await remote_execute_code(host=blender_host, port=req.blender_port, code=code)
+    except BlenderRemoteError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=502, detail=f"Remote Blender apply failed: {exc}") from exc
+
+    return ORJSONResponse(_applied_payload(req, response, code, provider, selected_model, blender_host))
+
+
+@app.post(
+    "/generate-and-apply/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+    openapi_extra=_request_body_openapi(GenerateAndApplyRequest),
+)
+async def generate_and_apply_stream(
+    request: Request,
+    authorization: str | None = Header(default=None),
+) -> StreamingResponse:
+    _require_authorization(authorization)
+    req = await _decode_body(request, GenerateAndApplyRequest)
+
+    prompt = req.prompt.strip()
+    if not prompt:
+        raise HTTPException(status_code=400, detail="Prompt cannot be empty")
+
+    blender_host = _resolve_blender_host(req, request)
+
+    try:
+        chunks, provider, selected_model = stream_python_code(
+            prompt=prompt,
+            model=req.model,
+            system_prompt=SYSTEM_PROMPT,
+            settings=settings,
+        )
+    except ProviderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return StreamingResponse(
+        _generate_and_apply_events(req, chunks, provider, selected_model, blender_host),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _resolve_blender_host(req: GenerateAndApplyRequest, request: Request) -> str:
     inferred_host = request.client.host if request.client else None
     blender_host = (req.blender_host or inferred_host or "").strip()
     if not blender_host:
@@ -156,24 +264,75 @@ def generate_and_apply(
             status_code=400,
             detail="Unable to determine Blender host. Provide blender_host explicitly.",
         )
+    return blender_host
 
-    try:
-        response = remote_execute_code(host=blender_host, port=req.blender_port, code=code)
-    except BlenderRemoteError as exc:
-        raise HTTPException(status_code=502, detail=str(exc)) from exc
-    except Exception as exc:
-        raise HTTPException(status_code=502, detail=f"Remote Blender apply failed: {exc}") from exc
 
+def _applied_payload(
+    req: GenerateAndApplyRequest,
+    response: Any,
+    code: str,
+    provider: str,
+    selected_model: str,
+    blender_host: str,
+) -> dict[str, Any]:
     message = response.get("message") if isinstance(response, dict) else None
     result = response.get("result") if isinstance(response, dict) else None
 
-    return GenerateAndApplyResponse(
-        applied=True,
-        provider=provider,
-        model=selected_model,
-        blender_host=blender_host,
-        blender_port=req.blender_port,
-        message=str(message or "Applied in Blender via remote backend."),
-        blender_result=result,
-        python_code=code if req.include_code else None,
-    )
+    return {
+        "applied": True,
+        "provider": provider,
+        "model": selected_model,
+        "blender_host": blender_host,
+        "blender_port": req.blender_port,
+        "message": str(message or "Applied in Blender via remote backend."),
+        "blender_result": result,
+        "python_code": code if req.include_code else None,
+    }
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _generate_and_apply_events(
+    req: GenerateAndApplyRequest,
+    chunks: AsyncGenerator[str, None],
+    provider: str,
+    selected_model: str,
+    blender_host: str,
+) -> AsyncIterator[bytes]:
+    # Tokens are forwarded as they arrive; Blender is contacted as soon as the
+    # first python-tagged fenced block closes instead of after the whole
+    # completion. Otherwise the code is picked from the full reply exactly
+    # as /generate-and-apply does.
+    scanner = FencedCodeScanner()
+    code = None
+
+    try:
+        async for delta in chunks:
+            yield _sse_event("token", delta)
+            code = scanner.feed(delta)
+            if code is not None:
+                break
+    except Exception as exc:
+        yield _sse_event("error", {"status": 500, "detail": f"Generation failed: {exc}"})
+        return
+    finally:
+        await chunks.aclose()
+
+    if code is None:
+        code = scanner.finish()
+    if not code:
+        yield _sse_event("error", {"status": 400, "detail": "Model response did not include Blender Python code."})
+        return
+
+    try:
+        response = await remote_execute_code(host=blender_host, port=req.blender_port, code=code)
+    except BlenderRemoteError as exc:
+        yield _sse_event("error", {"status": 502, "detail": str(exc)})
+        return
+    except Exception as exc:
+        yield _sse_event("error", {"status": 502, "detail": f"Remote Blender apply failed: {exc}"})
+        return
+
+    yield _sse_event("applied", _applied_payload(req, response, code, provider, selected_model, blender_host))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from anthropic import Anthropic
-from openai import OpenAI
+from functools import lru_cache
+from typing import Any, AsyncGenerator
+
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
 
 from .config import Settings
 
@@ -10,44 +13,126 @@ class ProviderError(RuntimeError):
     pass
 
 
+_NAMESPACED_PROVIDERS = {"groq": "groq", "openai": "openai", "anthropic": "anthropic"}
+
+
 def choose_provider(model: str, default_provider: str = "openai") -> str:
-    normalized = model.lower()
-    if normalized.startswith("groq/"):
-        return "groq"
-    if normalized.startswith("openai/"):
-        return "openai"
-    if normalized.startswith("anthropic/"):
-        return "anthropic"
+    head, sep, _ = model.partition("/")
+    normalized = head.lower()
+    if sep and normalized in _NAMESPACED_PROVIDERS:
+        return _NAMESPACED_PROVIDERS[normalized]
     if normalized.startswith("claude"):
         return "anthropic"
-    if normalized.startswith("llama") or normalized.startswith("mixtral"):
+    if normalized.startswith(("llama", "mixtral")):
         return "groq"
     return "openai"
 
 
 def _extract_python_block(text: str) -> str:
-    if "```" not in text:
+    first = text.find("```")
+    if first == -1:
         return text.strip()
 
-    marker = "```python"
-    lowered = text.lower()
-    start = lowered.find(marker)
-    if start == -1:
-        start = lowered.find("```")
-        start += 3
-    else:
-        start += len(marker)
+    # Prefer a block tagged python anywhere in the reply, falling back to the
+    # first fence. Fences are ASCII, so only the tag needs a case-insensitive
+    # check; this avoids lowercasing the whole response.
+    start = first
+    while start != -1:
+        if _is_python_fence(text, start):
+            return _fenced_body(text, start)
+        close = text.find("```", start + 3)
+        if close == -1:
+            break
+        start = text.find("```", close + 3)
+
+    return _fenced_body(text, first)
+
+
+def _is_python_fence(text: str, fence: int) -> bool:
+    return text[fence + 3 : fence + 9].lower() == "python"
+
 
-    end = lowered.find("```", start)
+def _fenced_body(text: str, fence: int) -> str:
+    start = fence + 3
+    if text[start : start + 6].lower() == "python":
+        start += 6
+    if text[start : start + 1] == "\n":
+        start += 1
+
+    end = text.find("```", start)
     if end == -1:
-        return text.strip()
+        return text[start:].strip()
 
     return text[start:end].strip()
 
 
+class FencedCodeScanner:
+    """Spots the first complete python-tagged fenced block in streamed output.
+
+    Untagged blocks and other languages are left to ``finish``, which picks
+    the same block as ``_extract_python_block`` does for the whole reply.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._open = -1
+        self._scan_from = 0
+        self._done = False
+
+    def feed(self, delta: str) -> str | None:
+        self._text += delta
+        if self._done:
+            return None
+
+        text = self._text
+        while True:
+            if self._open == -1:
+                self._open = text.find("```", self._scan_from)
+                if self._open == -1:
+                    # Step back two characters so a fence split across deltas is still found.
+                    self._scan_from = max(self._scan_from, len(text) - 2)
+                    return None
+                self._scan_from = self._open + 3
+
+            end = text.find("```", self._scan_from)
+            if end == -1:
+                self._scan_from = max(self._scan_from, len(text) - 2)
+                return None
+
+            if _is_python_fence(text, self._open):
+                self._done = True
+                return _fenced_body(text, self._open)
+
+            self._open = -1
+            self._scan_from = end + 3
+
+    def finish(self) -> str:
+        """Code from the whole output, for streams that never closed a python fence."""
+        return _extract_python_block(self._text)
+
+
 def _resolve_provider_and_model(model: str | None, settings: Settings) -> tuple[str, str]:
+    return _resolve_provider_and_model_cached(
+        model,
+        settings.default_provider,
+        settings.default_openai_model,
+        settings.default_anthropic_model,
+        settings.default_groq_model,
+    )
+
+
+# Requests overwhelmingly repeat a handful of model strings, so memoize the
+# resolution; the defaults are passed in explicitly to form the cache key.
+@lru_cache(maxsize=64)
+def _resolve_provider_and_model_cached(
+    model: str | None,
+    default_provider: str,
+    default_openai_model: str,
+    default_anthropic_model: str,
+    default_groq_model: str,
+) -> tuple[str, str]:
     requested = (model or "").strip()
-    default_provider = settings.default_provider.strip().lower()
+    default_provider = default_provider.strip().lower()
 
     if requested:
         provider = choose_provider(requested, default_provider=default_provider)
@@ -60,61 +145,34 @@ def _resolve_provider_and_model(model: str | None, settings: Settings) -> tuple[
             return provider, provider_model
 
     if default_provider == "anthropic":
-        return "anthropic", settings.default_anthropic_model
+        return "anthropic", default_anthropic_model
     if default_provider == "groq":
-        return "groq", settings.default_groq_model
-    return "openai", settings.default_openai_model
+        return "groq", default_groq_model
+    return "openai", default_openai_model
 
 
-def generate_python_code(prompt: str, model: str | None, system_prompt: str, settings: Settings) -> tuple[str, str, str]:
-    provider, selected_model = _resolve_provider_and_model(model, settings)
-
-    if provider == "openai":
-        if not settings.openai_api_key:
-            raise ProviderError("OPENAI_API_KEY is not configured.")
+def _messages(system_prompt: str, prompt: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt},
+    ]
 
-        client = OpenAI(api_key=settings.openai_api_key)
-        response = client.responses.create(
-            model=selected_model,
-            input=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-        )
-        text = getattr(response, "output_text", "") or ""
-        if not text:
-            raise ProviderError("OpenAI response was empty.")
-        return _extract_python_block(text), provider, f"openai/{selected_model}"
 
-    if provider == "groq":
-        if not settings.groq_api_key:
-            raise ProviderError("GROQ_API_KEY is not configured.")
+def _openai_text(response: Any) -> str:
+    text = getattr(response, "output_text", "") or ""
+    if not text:
+        raise ProviderError("OpenAI response was empty.")
+    return text
 
-        client = OpenAI(api_key=settings.groq_api_key, base_url=settings.groq_base_url)
-        response = client.chat.completions.create(
-            model=selected_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.2,
-        )
-        text = (response.choices[0].message.content or "").strip()
-        if not text:
-            raise ProviderError("Groq response was empty.")
-        return _extract_python_block(text), provider, f"groq/{selected_model}"
 
-    if not settings.anthropic_api_key:
-        raise ProviderError("ANTHROPIC_API_KEY is not configured.")
+def _groq_text(response: Any) -> str:
+    text = (response.choices[0].message.content or "").strip()
+    if not text:
+        raise ProviderError("Groq response was empty.")
+    return text
 
-    client = Anthropic(api_key=settings.anthropic_api_key)
-    message = client.messages.create(
-        model=selected_model or settings.default_anthropic_model,
-        max_tokens=2000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": prompt}],
-    )
 
+def _anthropic_text(message: Any) -> str:
     content = []
     for block in message.content:
         if getattr(block, "type", None) == "text":
@@ -123,5 +181,133 @@ def generate_python_code(prompt: str, model: str | None, system_prompt: str, set
     text = "\n".join(content).strip()
     if not text:
         raise ProviderError("Anthropic response was empty.")
+    return text
+
 
-    return _extract_python_block(text), provider, f"anthropic/{selected_model}"
+def _require_key(provider: str, settings: Settings) -> str:
+    if provider == "openai":
+        key, name = settings.openai_api_key, "OPENAI_API_KEY"
+    elif provider == "groq":
+        key, name = settings.groq_api_key, "GROQ_API_KEY"
+    else:
+        key, name = settings.anthropic_api_key, "ANTHROPIC_API_KEY"
+
+    if not key:
+        raise ProviderError(f"{name} is not configured.")
+    return key
+
+
+# SDK clients own an httpx connection pool; keeping one per credential set
+# lets requests reuse open keep-alive connections instead of a fresh TLS
+# handshake each time. The clients are safe to share across requests.
+@lru_cache(maxsize=None)
+def _openai_client(api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=None)
+def _anthropic_client(api_key: str) -> AsyncAnthropic:
+    return AsyncAnthropic(api_key=api_key)
+
+
+async def generate_python_code(
+    prompt: str,
+    model: str | None,
+    system_prompt: str,
+    settings: Settings,
+) -> tuple[str, str, str]:
+    provider, selected_model = _resolve_provider_and_model(model, settings)
+    api_key = _require_key(provider, settings)
+
+    if provider == "openai":
+        client = _openai_client(api_key)
+        response = await client.responses.create(
+            model=selected_model,
+            input=_messages(system_prompt, prompt),
+        )
+        text = _openai_text(response)
+    elif provider == "groq":
+        client = _openai_client(api_key, settings.groq_base_url)
+        response = await client.chat.completions.create(
+            model=selected_model,
+            messages=_messages(system_prompt, prompt),
+            temperature=0.2,
+        )
+        text = _groq_text(response)
+    else:
+        client = _anthropic_client(api_key)
+        message = await client.messages.create(
+            model=selected_model or settings.default_anthropic_model,
+            max_tokens=2000,
+            system=system_prompt,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        text = _anthropic_text(message)
+
+    return _extract_python_block(text), provider, f"{provider}/{selected_model}"
+
+
+def stream_python_code(
+    prompt: str,
+    model: str | None,
+    system_prompt: str,
+    settings: Settings,
+) -> tuple[AsyncGenerator[str, None], str, str]:
+    provider, selected_model = _resolve_provider_and_model(model, settings)
+    api_key = _require_key(provider, settings)
+
+    if provider == "openai":
+        chunks = _stream_openai(api_key, selected_model, system_prompt, prompt)
+    elif provider == "groq":
+        chunks = _stream_groq(api_key, settings.groq_base_url, selected_model, system_prompt, prompt)
+    else:
+        chunks = _stream_anthropic(
+            api_key,
+            selected_model or settings.default_anthropic_model,
+            system_prompt,
+            prompt,
+        )
+
+    return chunks, provider, f"{provider}/{selected_model}"
+
+
+async def _stream_openai(api_key: str, model: str, system_prompt: str, prompt: str) -> AsyncGenerator[str, None]:
+    stream = await _openai_client(api_key).responses.create(
+        model=model,
+        input=_messages(system_prompt, prompt),
+        stream=True,
+    )
+    async with stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta" and event.delta:
+                yield event.delta
+
+
+async def _stream_groq(
+    api_key: str,
+    base_url: str,
+    model: str,
+    system_prompt: str,
+    prompt: str,
+) -> AsyncGenerator[str, None]:
+    stream = await _openai_client(api_key, base_url).chat.completions.create(
+        model=model,
+        messages=_messages(system_prompt, prompt),
+        temperature=0.2,
+        stream=True,
+    )
+    async with stream:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def _stream_anthropic(api_key: str, model: str, system_prompt: str, prompt: str) -> AsyncGenerator[str, None]:
+    async with _anthropic_client(api_key).messages.stream(
+        model=model,
+        max_tokens=2000,
+        system=system_prompt,
+        messages=[{"role": "user", "content": prompt}],
+    ) as stream:
+        async for text in stream.text_stream:
+            yield text
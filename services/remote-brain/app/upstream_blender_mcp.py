@@ -9,6 +9,14 @@ UPSTREAM_DIR = ROOT / "external" / "blender-mcp"
 UPSTREAM_SERVER = UPSTREAM_DIR / "src" / "blender_mcp" / "server.py"
 UPSTREAM_ADDON = UPSTREAM_DIR / "addon.py"
 
+# Walk the function body line by line up to its first `return """` so the
+# match stays linear instead of backtracking through DOTALL wildcards.
+_STRATEGY_RE = re.compile(
+    r'def[ \t]+asset_creation_strategy\(\)[ \t]*->[ \t]*str:[^\n]*\n'
+    r'(?:[^\n]*\n)*?[ \t]*return[ \t]*"""(.*?)"""',
+    re.DOTALL,
+)
+
 
 def load_asset_creation_strategy() -> str:
     if not UPSTREAM_SERVER.exists():
@@ -16,11 +24,7 @@ def load_asset_creation_strategy() -> str:
 
     source = UPSTREAM_SERVER.read_text(encoding="utf-8", errors="ignore")
 
-    match = re.search(
-        r"def\s+asset_creation_strategy\(\)\s*->\s*str:\s*.*?return\s*\"\"\"(.*?)\"\"\"",
-        source,
-        re.DOTALL,
-    )
+    match = _STRATEGY_RE.search(source)
     if not match:
         return ""
 
@@ -49,3 +53,8 @@ def build_system_prompt() -> str:
         base.append("Reference strategy from upstream blender-mcp:\n" + strategy)
 
     return "\n\n".join(base)
+
+
+# The upstream strategy only changes when the vendored repo is re-synced,
+# so the prompt is built once at import and shared by every request.
+SYSTEM_PROMPT = build_system_prompt()
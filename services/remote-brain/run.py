@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+
+import uvicorn
+
+
+def main() -> None:
+    # uvloop has no Windows build; fall back to the stock asyncio loop there.
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8080")),
+        loop=loop,
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 1),
+    )
+
+
+if __name__ == "__main__":
+    main()